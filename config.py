@@ -1,12 +1,39 @@
 # config.py
-from typing import Set
+from typing import Dict, Set
 import asyncio
+import os
 from time import time
 
+from cachetools import TTLCache
+from crawl4ai import CacheMode, CrawlerRunConfig
+
 # Global cache and task management
-STOCK_CACHE = {}  # Global cache storage
 CACHE_TIME = 60  # Cache duration in seconds
+CACHE_MAX_SIZE = 5000  # Maximum number of cached scrape results, least recently used are evicted first
+STOCK_CACHE = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TIME)  # Global cache storage, expired entries are dropped on access/insert
+MAX_CACHE_ENTRY_BYTES = 512 * 1024  # Results larger than this (as JSON) are returned but not cached
 ACTIVE_TASKS: Set[asyncio.Task] = set()  # Track active webhook tasks
+INFLIGHT_SCRAPES: Dict[str, asyncio.Task] = {}  # Running scrapes by cache key, shared by concurrent callers
+SHUTDOWN_DRAIN_TIMEOUT = 10.0  # Seconds to wait for cancelled webhook tasks on shutdown
+MAX_CONCURRENT_SCRAPES = int(os.getenv("MAX_CONCURRENT_SCRAPES", "10"))  # Cap on background webhook scrapes running at once
+MAX_CONCURRENT_WEBHOOKS = int(os.getenv("MAX_CONCURRENT_WEBHOOKS", "50"))  # Cap on webhook POSTs in flight
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(os.cpu_count() or 4)))  # Threads for lxml selector parsing
+
+# LLM used for ai_extraction.custom_prompt (litellm-style "provider/model"); without a token,
+# crawl4ai reads the provider's usual environment variable (e.g. OPENAI_API_KEY)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai/gpt-4o-mini")
+LLM_API_TOKEN = os.getenv("LLM_API_TOKEN")
+
+# Retry backoff (full jitter): sleep a random time in [0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)]
+BACKOFF_BASE = 0.5  # Seconds
+BACKOFF_CAP = 30.0  # Seconds, also caps how long a Retry-After header can make us wait
+RETRY_STATUS_CODES = (429, 503)  # Rate-limit/overload responses that are retried instead of extracted
+
+# Webhook circuit breaker: after WEBHOOK_CIRCUIT_THRESHOLD consecutive failures to a host, skip it
+# until WEBHOOK_CIRCUIT_RESET seconds have passed since its last failure
+WEBHOOK_CIRCUIT_THRESHOLD = 10
+WEBHOOK_CIRCUIT_RESET = 300  # Seconds
+WEBHOOK_FAILURES = TTLCache(maxsize=1000, ttl=WEBHOOK_CIRCUIT_RESET)  # Consecutive failures by webhook host
 
 # Default crawl4ai configuration
 DEFAULT_CRAWLER_CONFIG = {
@@ -27,3 +54,21 @@ FAST_CRAWLER_CONFIG = {
     "simulate_user": False,
     "verbose": False,
 }
+
+
+def _build_run_config(settings: dict) -> CrawlerRunConfig:
+    """Build a crawl4ai run config from one of the settings dicts above"""
+    return CrawlerRunConfig(
+        user_agent=settings["user_agent"],
+        delay_before_return_html=settings["delay_before_return_html"],
+        cache_mode=CacheMode.BYPASS,
+        page_timeout=settings["page_timeout"],
+        remove_overlay_elements=settings["remove_overlay_elements"],
+        simulate_user=settings["simulate_user"],
+        verbose=settings["verbose"],
+    )
+
+
+# Run configs are built once at import and shared by every crawl
+DEFAULT_CRAWLER_RUN_CONFIG = _build_run_config(DEFAULT_CRAWLER_CONFIG)
+FAST_CRAWLER_RUN_CONFIG = _build_run_config(FAST_CRAWLER_CONFIG)
@@ -1,41 +1,57 @@
 # main.py
 import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from loguru import logger as log
-from time import time
+from crawl4ai import AsyncWebCrawler
 
-from config import STOCK_CACHE, CACHE_TIME, ACTIVE_TASKS
+from config import ACTIVE_TASKS, INFLIGHT_SCRAPES, MAX_CONCURRENT_SCRAPES, MAX_CONCURRENT_WEBHOOKS, SHUTDOWN_DRAIN_TIMEOUT
 from routes import router
+from scraper import create_webhook_client
+
+
+async def drain_active_tasks():
+    """Cancel active webhook tasks and in-flight scrapes and wait (bounded) for them to finish"""
+    # Scrapes are shielded from their callers, so cancelling a webhook task does not stop them;
+    # cancel them explicitly before the crawler closes. Iterate snapshots since done callbacks mutate both.
+    pending = [task for task in [*ACTIVE_TASKS, *INFLIGHT_SCRAPES.values()] if not task.done()]
+    for task in pending:
+        task.cancel()
+    # Wait for tasks to complete, but never let a stuck task block shutdown
+    if pending:
+        try:
+            await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), timeout=SHUTDOWN_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            log.warning(f"Shutdown drain timed out after {SHUTDOWN_DRAIN_TIMEOUT}s")
+
+
+# Startup and shutdown handling
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log.info("Starting web scraper API with crawl4ai")
+    # One browser and one webhook client for the whole app, closed in reverse order on exit
+    # (both are created per lifespan, so the app can be started again after a shutdown)
+    async with create_webhook_client() as webhook_client, AsyncWebCrawler(verbose=False) as crawler:
+        app.state.webhook_client = webhook_client
+        # Caps webhook POSTs in flight; sized like the client's pool and, like the client, built per lifespan
+        app.state.webhook_semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_WEBHOOKS)
+        app.state.crawler = crawler
+        # Limits how many background webhook scrapes drive the browser at once; built here because
+        # an asyncio semaphore binds to the loop it first waits on
+        app.state.scrape_semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_SCRAPES)
+        yield
+        log.info("Shutting down web scraper API")
+        await drain_active_tasks()
+
 
 # Create API app object
-app = FastAPI(title="Advanced Web Scraper API", version="2.0.0")
+app = FastAPI(
+    title="Advanced Web Scraper API",
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Include all routes
 app.include_router(router)
-
-# Startup and shutdown event handlers
-@app.on_event("startup")
-async def app_startup():
-    log.info("Starting web scraper API with crawl4ai")
-    # Clear expired cache every minute to prevent memory build up
-    async def clear_expired_cache(period=60.0):
-        while True:
-            global STOCK_CACHE
-            log.debug(f"clearing expired cache")
-            STOCK_CACHE = {
-                k: v for k, v in STOCK_CACHE.items() if time() - CACHE_TIME < v["_scraped_on"]
-            }
-            await asyncio.sleep(period)
-    clear_cache_task = asyncio.create_task(clear_expired_cache())
-
-
-@app.on_event("shutdown")
-async def app_shutdown():
-    log.info("Shutting down web scraper API")
-    # Cancel all active webhook tasks
-    for task in ACTIVE_TASKS:
-        if not task.done():
-            task.cancel()
-    # Wait for tasks to complete
-    if ACTIVE_TASKS:
-        await asyncio.gather(*ACTIVE_TASKS, return_exceptions=True)
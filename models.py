@@ -1,4 +1,6 @@
 # models.py
+import hashlib
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, HttpUrl
 
@@ -33,6 +35,24 @@ class ScrapeRequest(BaseModel):
     cache_key: Optional[str] = None  # Optional custom cache key
     max_retries: int = 3  # Number of retry attempts
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable cache key built from the fields that affect the scraped output"""
+        ai = self.ai_extraction
+        key = (
+            str(self.url),
+            tuple((s.name, s.selector, s.attribute, s.is_xpath) for s in (self.selectors or ())),
+            (
+                ai.extract_entities, ai.extract_sentiment, ai.extract_keywords,
+                ai.extract_summary, ai.custom_prompt,
+            ) if ai else None,
+            self.extract_structured_data,
+            self.extract_links,
+            self.extract_images,
+            self.extract_text,
+        )
+        return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
 
 class ScrapeResponse(BaseModel):
     """Response model for scraping results"""
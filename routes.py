@@ -1,8 +1,10 @@
 # routes.py
 import asyncio
 from typing import Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+import httpx
 from loguru import logger as log
+from crawl4ai import AsyncWebCrawler
 
 from models import ScrapeRequest, ScrapeResponse, AIExtractionConfig
 from scraper import scrape_dynamic, scrape_fast, with_webhook
@@ -11,14 +13,39 @@ from config import ACTIVE_TASKS
 # Create router for all scraping endpoints
 router = APIRouter()
 
+def get_crawler(http_request: Request) -> AsyncWebCrawler:
+    """Return the shared crawl4ai browser started in the app lifespan"""
+    return http_request.app.state.crawler
+
+
+def get_webhook_client(http_request: Request) -> httpx.AsyncClient:
+    """Return the shared webhook client opened in the app lifespan"""
+    return http_request.app.state.webhook_client
+
+
+def get_webhook_semaphore(http_request: Request) -> asyncio.Semaphore:
+    """Return the webhook POST limiter created in the app lifespan"""
+    return http_request.app.state.webhook_semaphore
+
+
+def get_scrape_semaphore(http_request: Request) -> asyncio.Semaphore:
+    """Return the webhook scrape limiter created in the app lifespan"""
+    return http_request.app.state.scrape_semaphore
+
 
 @router.post("/scrape", response_model=ScrapeResponse)
-async def scrape_dynamic_endpoint(request: ScrapeRequest):
+async def scrape_dynamic_endpoint(
+    request: ScrapeRequest,
+    crawler: AsyncWebCrawler = Depends(get_crawler),
+    webhook_client: httpx.AsyncClient = Depends(get_webhook_client),
+    webhook_semaphore: asyncio.Semaphore = Depends(get_webhook_semaphore),
+    scrape_semaphore: asyncio.Semaphore = Depends(get_scrape_semaphore),
+):
     """Advanced web scraper endpoint - multiple extraction methods with crawl4ai"""
     try:
         if request.webhook:
             # Run scraping in background and send to webhook
-            task = asyncio.create_task(with_webhook(request))
+            task = asyncio.create_task(with_webhook(request, crawler, webhook_client, webhook_semaphore, scrape_semaphore))
             ACTIVE_TASKS.add(task)
             task.add_done_callback(ACTIVE_TASKS.discard)
             return ScrapeResponse(
@@ -28,7 +55,7 @@ async def scrape_dynamic_endpoint(request: ScrapeRequest):
             )
         else:
             # Direct scraping
-            result = await scrape_dynamic(request)
+            result = await scrape_dynamic(request, crawler)
             return ScrapeResponse(
                 success=True,
                 data=result,
@@ -47,7 +74,7 @@ async def scrape_dynamic_endpoint(request: ScrapeRequest):
 
 
 @router.post("/scrape/simple")
-async def scrape_simple(url: str, extract_all: bool = True):
+async def scrape_simple(url: str, extract_all: bool = True, crawler: AsyncWebCrawler = Depends(get_crawler)):
     """Simple scraping endpoint - just provide a URL and get everything extracted"""
     try:
         request = ScrapeRequest(
@@ -63,7 +90,7 @@ async def scrape_simple(url: str, extract_all: bool = True):
             ) if extract_all else None
         )
         
-        result = await scrape_dynamic(request)
+        result = await scrape_dynamic(request, crawler)
         return {
             "success": True,
             "url": url,
@@ -78,10 +105,10 @@ async def scrape_simple(url: str, extract_all: bool = True):
 
 
 @router.post("/scrape/fast")
-async def scrape_fast_endpoint(url: str, extract_basic: bool = True):
+async def scrape_fast_endpoint(url: str, extract_basic: bool = True, include_html: bool = True, crawler: AsyncWebCrawler = Depends(get_crawler)):
     """Fast scraping endpoint - optimized for speed with minimal features"""
     try:
-        result = await scrape_fast(url, extract_basic)
+        result = await scrape_fast(url, crawler, extract_basic, include_html)
         return {
             "success": True,
             "url": url,
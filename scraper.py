@@ -1,112 +1,165 @@
 # scraper.py
 import asyncio
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
 import httpx
+import orjson
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from time import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from loguru import logger as log
 from fastapi import HTTPException
 
-from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig
-from bs4 import BeautifulSoup
-from lxml import html
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, LLMConfig, LLMExtractionStrategy
+from lxml import etree, html
+from lxml.cssselect import CSSSelector
 
-from models import ScrapeRequest
-from config import STOCK_CACHE, CACHE_TIME, DEFAULT_CRAWLER_CONFIG, FAST_CRAWLER_CONFIG
+from models import ScrapeRequest, ScrapeSelector, AIExtractionConfig
+from config import (
+    STOCK_CACHE, MAX_CACHE_ENTRY_BYTES, INFLIGHT_SCRAPES, DEFAULT_CRAWLER_RUN_CONFIG, FAST_CRAWLER_RUN_CONFIG,
+    BACKOFF_BASE, BACKOFF_CAP, RETRY_STATUS_CODES, WEBHOOK_CIRCUIT_THRESHOLD, WEBHOOK_FAILURES,
+    MAX_CONCURRENT_WEBHOOKS, PARSE_WORKERS, LLM_PROVIDER, LLM_API_TOKEN,
+)
 
+# XML prolog (<?xml ... encoding=...?>) that lxml refuses on already-decoded str input
+XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
 
-async def scrape_dynamic(request: ScrapeRequest) -> Dict[str, Any]:
+# Dedicated threads for selector parsing; lxml releases the GIL while parsing. The pool lives for the
+# whole process (not a single lifespan), so it is never shut down while the app may start again
+PARSE_POOL = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="parse")
+
+
+def _retry_after(headers) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date"""
+    if not headers:
+        return None
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Full-jitter exponential backoff, using Retry-After (capped) as a floor"""
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, BACKOFF_CAP))
+    return delay
+
+
+async def scrape_dynamic(request: ScrapeRequest, crawler: AsyncWebCrawler) -> Dict[str, Any]:
     """Advanced web scraper with multiple extraction methods using crawl4ai"""
     # Generate cache key
-    cache_key = request.cache_key or f"{request.url}_{hash(str(request.dict()))}"
+    cache_key = request.cache_key or request.fingerprint
     
     # Check cache first
     cache = STOCK_CACHE.get(cache_key)
-    if cache and time() - CACHE_TIME < cache["_scraped_on"]:
+    if cache:
         log.debug(f"Cache hit for {cache_key}")
         return cache
 
+    # Join a scrape already running for this key instead of launching another one
+    task = INFLIGHT_SCRAPES.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_scrape_dynamic_uncached(request, crawler, cache_key))
+        INFLIGHT_SCRAPES[cache_key] = task
+        task.add_done_callback(lambda _: INFLIGHT_SCRAPES.pop(cache_key, None))
+    else:
+        log.debug(f"Joining in-flight scrape for {cache_key}")
+    # Shield so one caller disconnecting does not cancel the scrape for the others
+    return await asyncio.shield(task)
+
+
+async def _scrape_dynamic_uncached(request: ScrapeRequest, crawler: AsyncWebCrawler, cache_key: str) -> Dict[str, Any]:
+    """Run the crawl4ai scrape with retries and store the result in the cache"""
     log.info(f"Scraping {request.url} using crawl4ai with multiple extraction methods")
     
-    for attempt in range(request.max_retries):
+    # Only the page fetch is retried; extraction branches handle their own errors
+    result = await _arun_with_retries(crawler, str(request.url), _run_config_for(request), request.max_retries)
+    parsed_data = await _extract_data_from_result(result, request)
+    
+    # Add metadata
+    parsed_data["_scraped_on"] = time()
+    parsed_data["_url"] = str(request.url)
+    parsed_data["_crawl4ai_used"] = True
+    
+    # Store in cache, unless the payload is big enough to crowd out many smaller entries
+    entry_size = len(orjson.dumps(parsed_data, default=str))
+    if entry_size <= MAX_CACHE_ENTRY_BYTES:
+        STOCK_CACHE[cache_key] = parsed_data
+    else:
+        log.debug(f"Not caching {cache_key}: {entry_size} bytes exceeds {MAX_CACHE_ENTRY_BYTES}")
+    log.info(f"Successfully scraped {request.url} using crawl4ai with advanced extraction")
+    return parsed_data
+
+
+def _run_config_for(request: ScrapeRequest) -> CrawlerRunConfig:
+    """Main crawl config, running the custom AI prompt as an LLM extraction on the same crawl"""
+    ai = request.ai_extraction
+    if not (ai and ai.custom_prompt):
+        return DEFAULT_CRAWLER_RUN_CONFIG
+    strategy = LLMExtractionStrategy(
+        llm_config=LLMConfig(provider=LLM_PROVIDER, api_token=LLM_API_TOKEN),
+        instruction=ai.custom_prompt,
+        extraction_type="block",
+    )
+    return DEFAULT_CRAWLER_RUN_CONFIG.clone(extraction_strategy=strategy)
+
+
+async def _arun_with_retries(crawler: AsyncWebCrawler, url: str, config: CrawlerRunConfig, max_retries: int):
+    """Fetch a page with the shared crawler, retrying failed or rate-limited crawls with backoff"""
+    attempts = max(1, max_retries)
+    for attempt in range(attempts):
+        retry_after = None
         try:
-            # Create crawl4ai configuration
-            config = CrawlerRunConfig(
-                user_agent=DEFAULT_CRAWLER_CONFIG["user_agent"],
-                delay_before_return_html=DEFAULT_CRAWLER_CONFIG["delay_before_return_html"],
-                cache_mode=CacheMode.BYPASS,
-                page_timeout=DEFAULT_CRAWLER_CONFIG["page_timeout"],
-                remove_overlay_elements=DEFAULT_CRAWLER_CONFIG["remove_overlay_elements"],
-                simulate_user=DEFAULT_CRAWLER_CONFIG["simulate_user"],
-                verbose=DEFAULT_CRAWLER_CONFIG["verbose"],
-            )
-            
-            # Use crawl4ai to scrape the page
-            async with AsyncWebCrawler(verbose=True) as crawler:
-                result = await crawler.arun(url=str(request.url), config=config)
-                
-                if not result.success:
-                    log.warning(f"crawl4ai failed: {result.error_message}, attempt {attempt + 1}/{request.max_retries}")
-                    if attempt < request.max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-                        continue
-                    else:
-                        raise HTTPException(status_code=500, detail=f"crawl4ai failed: {result.error_message}")
-                
-                parsed_data = await _extract_data_from_result(result, request)
-                
-                # Add metadata
-                parsed_data["_scraped_on"] = time()
-                parsed_data["_url"] = str(request.url)
-                parsed_data["_crawl4ai_used"] = True
-                
-                # Store in cache
-                STOCK_CACHE[cache_key] = parsed_data
-                log.info(f"Successfully scraped {request.url} using crawl4ai with advanced extraction")
-                return parsed_data
-                
+            result = await crawler.arun(url=url, config=config)
+            # A rate-limited page still renders, so check the status code before extracting it
+            status_code = getattr(result, "status_code", None)
+            if result.success and status_code not in RETRY_STATUS_CODES:
+                return result
+            error = result.error_message or f"HTTP {status_code}"
+            retry_after = _retry_after(getattr(result, "response_headers", None))
         except Exception as e:
-            log.error(f"Error {str(e)}, attempt {attempt + 1}/{request.max_retries}")
-            if attempt < request.max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
-                continue
-            else:
-                raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
+            error = str(e)
+        log.warning(f"crawl4ai failed: {error}, attempt {attempt + 1}/{attempts}")
+        if attempt < attempts - 1:
+            await asyncio.sleep(_backoff_delay(attempt, retry_after))
+    raise HTTPException(status_code=500, detail=f"Scraping failed: {error}")
 
 
-async def scrape_fast(url: str, extract_basic: bool = True) -> Dict[str, Any]:
+async def scrape_fast(url: str, crawler: AsyncWebCrawler, extract_basic: bool = True, include_html: bool = True) -> Dict[str, Any]:
     """Fast scraping with minimal features for speed optimization"""
     try:
-        # Use fast configuration
-        config = CrawlerRunConfig(
-            user_agent=FAST_CRAWLER_CONFIG["user_agent"],
-            delay_before_return_html=FAST_CRAWLER_CONFIG["delay_before_return_html"],
-            cache_mode=CacheMode.BYPASS,
-            page_timeout=FAST_CRAWLER_CONFIG["page_timeout"],
-            remove_overlay_elements=FAST_CRAWLER_CONFIG["remove_overlay_elements"],
-            simulate_user=FAST_CRAWLER_CONFIG["simulate_user"],
-            verbose=FAST_CRAWLER_CONFIG["verbose"],
-        )
+        # Direct crawl4ai call for speed, using the fast configuration
+        result = await crawler.arun(url=url, config=FAST_CRAWLER_RUN_CONFIG)
+        
+        if not result.success:
+            raise HTTPException(status_code=500, detail=f"crawl4ai failed: {result.error_message}")
+        
+        # Basic extraction
+        parsed_data = {}
+        if extract_basic:
+            if include_html:
+                page_html = result.html
+                parsed_data["html"] = (page_html[:1000] + "...") if len(page_html) > 1000 else page_html
+            parsed_data["title"] = getattr(result, 'title', None)
+            parsed_data["url"] = getattr(result, 'url', url)
+        
+        parsed_data["_scraped_on"] = time()
+        parsed_data["_crawl4ai_used"] = True
+        parsed_data["_fast_mode"] = True
+        
+        return parsed_data
         
-        # Direct crawl4ai call for speed
-        async with AsyncWebCrawler(verbose=False) as crawler:
-            result = await crawler.arun(url=url, config=config)
-            
-            if not result.success:
-                raise HTTPException(status_code=500, detail=f"crawl4ai failed: {result.error_message}")
-            
-            # Basic extraction
-            parsed_data = {}
-            if extract_basic:
-                parsed_data["html"] = result.html[:1000] + "..." if len(result.html) > 1000 else result.html
-                parsed_data["title"] = result.title if hasattr(result, 'title') else None
-                parsed_data["url"] = result.url if hasattr(result, 'url') else url
-            
-            parsed_data["_scraped_on"] = time()
-            parsed_data["_crawl4ai_used"] = True
-            parsed_data["_fast_mode"] = True
-            
-            return parsed_data
-            
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Fast scraping failed: {str(e)}")
 
@@ -115,48 +168,15 @@ async def _extract_data_from_result(result, request: ScrapeRequest) -> Dict[str,
     """Extract data from crawl4ai result based on request configuration"""
     parsed_data = {}
     
-    # 1. Extract using custom selectors (if provided)
+    # 1. Extract using custom selectors (if provided), parsing on PARSE_POOL so it does not block the event loop
     if request.selectors:
-        soup = BeautifulSoup(result.html, 'html.parser')
-        
-        for selector_config in request.selectors:
-            try:
-                if selector_config.is_xpath:
-                    # XPath extraction
-                    tree = html.fromstring(result.html)
-                    elements = tree.xpath(selector_config.selector)
-                    
-                    if elements:
-                        if selector_config.attribute:
-                            values = [elem.get(selector_config.attribute) for elem in elements if elem.get(selector_config.attribute)]
-                            parsed_data[selector_config.name] = values
-                        else:
-                            values = [elem.text_content().strip() for elem in elements if elem.text_content()]
-                            parsed_data[selector_config.name] = [v for v in values if v]
-                    else:
-                        parsed_data[selector_config.name] = None
-                else:
-                    # CSS selector extraction
-                    elements = soup.select(selector_config.selector)
-                    
-                    if elements:
-                        if selector_config.attribute:
-                            values = [elem.get(selector_config.attribute) for elem in elements if elem.get(selector_config.attribute)]
-                            parsed_data[selector_config.name] = values
-                        else:
-                            values = [elem.get_text(strip=True) for elem in elements]
-                            parsed_data[selector_config.name] = [v for v in values if v]
-                    else:
-                        parsed_data[selector_config.name] = None
-                        
-            except Exception as e:
-                log.warning(f"Failed to extract {selector_config.name}: {e}")
-                parsed_data[selector_config.name] = None
+        loop = asyncio.get_running_loop()
+        parsed_data.update(await loop.run_in_executor(PARSE_POOL, _extract_selectors, result.html, request.selectors))
     
     # 2. Extract structured data (JSON-LD, microdata, etc.)
     if request.extract_structured_data:
         try:
-            structured_data = result.structured_data if hasattr(result, 'structured_data') else {}
+            structured_data = getattr(result, 'structured_data', {})
             parsed_data["structured_data"] = structured_data
         except Exception as e:
             log.warning(f"Failed to extract structured data: {e}")
@@ -165,7 +185,7 @@ async def _extract_data_from_result(result, request: ScrapeRequest) -> Dict[str,
     # 3. Extract links
     if request.extract_links:
         try:
-            links = result.links if hasattr(result, 'links') else []
+            links = getattr(result, 'links', [])
             parsed_data["links"] = links
         except Exception as e:
             log.warning(f"Failed to extract links: {e}")
@@ -174,7 +194,7 @@ async def _extract_data_from_result(result, request: ScrapeRequest) -> Dict[str,
     # 4. Extract images
     if request.extract_images:
         try:
-            images = result.images if hasattr(result, 'images') else []
+            images = getattr(result, 'images', [])
             parsed_data["images"] = images
         except Exception as e:
             log.warning(f"Failed to extract images: {e}")
@@ -183,7 +203,7 @@ async def _extract_data_from_result(result, request: ScrapeRequest) -> Dict[str,
     # 5. Extract clean text
     if request.extract_text:
         try:
-            clean_text = result.cleaned_html if hasattr(result, 'cleaned_html') else result.html
+            clean_text = getattr(result, 'cleaned_html', result.html)
             parsed_data["clean_text"] = clean_text
         except Exception as e:
             log.warning(f"Failed to extract clean text: {e}")
@@ -191,77 +211,163 @@ async def _extract_data_from_result(result, request: ScrapeRequest) -> Dict[str,
     
     # 6. AI-powered extraction
     if request.ai_extraction:
+        parsed_data["ai_extraction"] = _extract_ai(result, request.ai_extraction)
+    
+    return parsed_data
+
+
+@lru_cache(maxsize=1024)
+def _compile_xpath(expr: str) -> etree.XPath:
+    """Compile an XPath selector once and reuse it across requests"""
+    return etree.XPath(expr)
+
+
+@lru_cache(maxsize=1024)
+def _compile_css(expr: str) -> CSSSelector:
+    """Translate and compile a CSS selector once and reuse it across requests"""
+    return CSSSelector(expr, translator="html")
+
+
+def _extract_selectors(page_html: str, selectors: List[ScrapeSelector]) -> Dict[str, Any]:
+    """Run custom CSS/XPath selectors against the page (blocking, meant for a worker thread)"""
+    parsed_data = {}
+    
+    # Parse once with lxml and run every CSS/XPath selector off the same tree
+    try:
         try:
-            ai_data = {}
-            
-            if request.ai_extraction.extract_entities:
-                entities = result.entities if hasattr(result, 'entities') else []
-                ai_data["entities"] = entities
-            
-            if request.ai_extraction.extract_sentiment:
-                sentiment = result.sentiment if hasattr(result, 'sentiment') else None
-                ai_data["sentiment"] = sentiment
-            
-            if request.ai_extraction.extract_keywords:
-                keywords = result.keywords if hasattr(result, 'keywords') else []
-                ai_data["keywords"] = keywords
-            
-            if request.ai_extraction.extract_summary:
-                summary = result.summary if hasattr(result, 'summary') else None
-                ai_data["summary"] = summary
-            
-            if request.ai_extraction.custom_prompt:
-                # Custom AI extraction using the prompt
-                config = CrawlerRunConfig(
-                    user_agent=DEFAULT_CRAWLER_CONFIG["user_agent"],
-                    delay_before_return_html=DEFAULT_CRAWLER_CONFIG["delay_before_return_html"],
-                    cache_mode=CacheMode.BYPASS,
-                    page_timeout=DEFAULT_CRAWLER_CONFIG["page_timeout"],
-                    remove_overlay_elements=DEFAULT_CRAWLER_CONFIG["remove_overlay_elements"],
-                    simulate_user=DEFAULT_CRAWLER_CONFIG["simulate_user"],
-                    verbose=DEFAULT_CRAWLER_CONFIG["verbose"],
-                )
-                async with AsyncWebCrawler(verbose=True) as crawler:
-                    custom_result = await crawler.arun(
-                        url=str(request.url), 
-                        config=config,
-                        extraction_strategy=request.ai_extraction.custom_prompt
-                    )
-                    ai_data["custom_extraction"] = custom_result.extracted_content if hasattr(custom_result, 'extracted_content') else None
-            
-            parsed_data["ai_extraction"] = ai_data
+            tree = html.fromstring(page_html)
+        except ValueError:
+            # The page text is already decoded, so drop the encoding declaration and parse again
+            tree = html.fromstring(XML_DECLARATION.sub("", page_html, count=1))
+    except Exception as e:
+        log.warning(f"Failed to parse HTML for selectors: {e}")
+        return {selector_config.name: None for selector_config in selectors}
+    
+    for selector_config in selectors:
+        try:
+            # XPath or CSS selector extraction
+            compile_selector = _compile_xpath if selector_config.is_xpath else _compile_css
+            elements = compile_selector(selector_config.selector)(tree)
             
+            if elements:
+                # Read each attribute/text once; text_content() walks the element's whole subtree
+                attribute = selector_config.attribute
+                if attribute:
+                    values = (elem.get(attribute) for elem in elements)
+                else:
+                    values = (elem.text_content().strip() for elem in elements)
+                parsed_data[selector_config.name] = [v for v in values if v]
+            else:
+                parsed_data[selector_config.name] = None
+                
         except Exception as e:
-            log.warning(f"Failed AI extraction: {e}")
-            parsed_data["ai_extraction"] = {"error": str(e)}
+            log.warning(f"Failed to extract {selector_config.name}: {e}")
+            parsed_data[selector_config.name] = None
     
     return parsed_data
 
 
-async def with_webhook(scrape_request: ScrapeRequest, retries=3):
+def _extract_ai(result, ai_extraction: AIExtractionConfig) -> Dict[str, Any]:
+    """AI-powered extraction from the crawl result, including the custom-prompt output"""
+    try:
+        ai_data = {}
+        
+        if ai_extraction.extract_entities:
+            entities = getattr(result, 'entities', [])
+            ai_data["entities"] = entities
+        
+        if ai_extraction.extract_sentiment:
+            sentiment = getattr(result, 'sentiment', None)
+            ai_data["sentiment"] = sentiment
+        
+        if ai_extraction.extract_keywords:
+            keywords = getattr(result, 'keywords', [])
+            ai_data["keywords"] = keywords
+        
+        if ai_extraction.extract_summary:
+            summary = getattr(result, 'summary', None)
+            ai_data["summary"] = summary
+        
+        if ai_extraction.custom_prompt:
+            # The prompt ran as the LLM extraction strategy of the main crawl
+            ai_data["custom_extraction"] = getattr(result, 'extracted_content', None)
+        
+        return ai_data
+        
+    except Exception as e:
+        log.warning(f"Failed AI extraction: {e}")
+        return {"error": str(e)}
+
+
+def create_webhook_client() -> httpx.AsyncClient:
+    """Build the webhook client the app lifespan shares across deliveries"""
+    return httpx.AsyncClient(
+        headers={"User-Agent": "scraper webhook"},
+        timeout=httpx.Timeout(timeout=15.0),
+        # The lifespan's webhook semaphore already caps POSTs in flight, so size the pool to match it
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENT_WEBHOOKS,
+            max_keepalive_connections=min(20, MAX_CONCURRENT_WEBHOOKS),
+            keepalive_expiry=30,
+        ),
+    )
+
+
+async def _post_webhook(
+    webhook_client: httpx.AsyncClient,
+    webhook_semaphore: asyncio.Semaphore,
+    url: str,
+    payload: Dict[str, Any],
+) -> httpx.Response:
+    """POST a JSON payload with the shared client, capped at MAX_CONCURRENT_WEBHOOKS in flight"""
+    async with webhook_semaphore:
+        return await webhook_client.post(url, content=orjson.dumps(payload), headers={"Content-Type": "application/json"})
+
+
+async def with_webhook(
+    scrape_request: ScrapeRequest,
+    crawler: AsyncWebCrawler,
+    webhook_client: httpx.AsyncClient,
+    webhook_semaphore: asyncio.Semaphore,
+    scrape_semaphore: asyncio.Semaphore,
+    retries=3,
+):
     """Execute scraping and send result to webhook"""
+    # Fail fast on hosts that keep failing instead of scraping for a dead endpoint
+    host = scrape_request.webhook.host
+    if WEBHOOK_FAILURES.get(host, 0) >= WEBHOOK_CIRCUIT_THRESHOLD:
+        log.warning(f"Skipping webhook to {host}: circuit open after {WEBHOOK_FAILURES[host]} consecutive failures")
+        return
     try:
-        result = await scrape_dynamic(scrape_request)
-        async with httpx.AsyncClient(
-            headers={"User-Agent": "scraper webhook"},
-            timeout=httpx.Timeout(timeout=15.0),
-        ) as client:
-            for i in range(retries):
-                try:
-                    response = await client.post(str(scrape_request.webhook), json=result)
-                    log.info(f"Webhook sent successfully to {scrape_request.webhook}")
-                    return
-                except Exception as e:
-                    log.exception(f"Failed to send webhook {i}/{retries}: {e}")
-                await asyncio.sleep(5)  # wait between retries
-            log.error(f"Failed to reach webhook in {retries} retries")
+        # Hold a scrape slot only while the browser works, not during webhook delivery and its backoff
+        async with scrape_semaphore:
+            result = await scrape_dynamic(scrape_request, crawler)
+        for i in range(retries):
+            retry_after = None
+            try:
+                response = await _post_webhook(webhook_client, webhook_semaphore, str(scrape_request.webhook), result)
+                response.raise_for_status()
+                WEBHOOK_FAILURES.pop(host, None)
+                log.info(f"Webhook sent successfully to {scrape_request.webhook}")
+                return
+            except httpx.HTTPStatusError as e:
+                retry_after = _retry_after(e.response.headers)
+                log.warning(f"Failed to send webhook {i}/{retries}: {e}")
+            except Exception as e:
+                log.exception(f"Failed to send webhook {i}/{retries}: {e}")
+            WEBHOOK_FAILURES[host] = WEBHOOK_FAILURES.get(host, 0) + 1
+            if WEBHOOK_FAILURES[host] >= WEBHOOK_CIRCUIT_THRESHOLD:
+                log.error(f"Opening webhook circuit for {host} after {WEBHOOK_FAILURES[host]} consecutive failures")
+                return
+            if i < retries - 1:
+                await asyncio.sleep(_backoff_delay(i, retry_after))  # wait between retries
+        log.error(f"Failed to reach webhook in {retries} retries")
     except Exception as e:
         log.error(f"Scraping failed for webhook: {e}")
         # Send error to webhook if possible
         if scrape_request.webhook:
             try:
                 error_data = {"error": str(e), "url": str(scrape_request.url)}
-                async with httpx.AsyncClient(timeout=15.0) as client:
-                    await client.post(str(scrape_request.webhook), json=error_data)
+                await _post_webhook(webhook_client, webhook_semaphore, str(scrape_request.webhook), error_data)
             except:
                 pass
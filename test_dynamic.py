@@ -69,43 +69,53 @@ async def test_dynamic_scraper():
         print("🧪 Testing Dynamic Web Scraper")
         print("=" * 50)
         
+        # The probes are independent, so send them concurrently
+        url = "http://localhost:8000/scrape"
+        yahoo_response, news_response, webhook_response = await asyncio.gather(
+            client.post(url, json=yahoo_request, timeout=30.0),
+            client.post(url, json=news_request, timeout=30.0),
+            client.post(url, json=webhook_request, timeout=30.0),
+            return_exceptions=True,
+        )
+        
         # Test 1: Yahoo Finance
         print("\n1️⃣ Testing Yahoo Finance scraping...")
-        try:
-            response = await client.post(
-                "http://localhost:8000/scrape",
-                json=yahoo_request,
-                timeout=30.0
-            )
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ Success: {result['success']}")
-                if result.get('data'):
-                    print(f"📊 Price: {result['data'].get('price')}")
-                    print(f"🏢 Company: {result['data'].get('company_name')}")
-                    print(f"📈 Change: {result['data'].get('change')}")
-            else:
-                print(f"❌ Error: {response.status_code} - {response.text}")
-        except Exception as e:
-            print(f"❌ Exception: {e}")
+        if isinstance(yahoo_response, Exception):
+            print(f"❌ Exception: {yahoo_response}")
+        elif yahoo_response.status_code == 200:
+            result = yahoo_response.json()
+            print(f"✅ Success: {result['success']}")
+            if result.get('data'):
+                print(f"📊 Price: {result['data'].get('price')}")
+                print(f"🏢 Company: {result['data'].get('company_name')}")
+                print(f"📈 Change: {result['data'].get('change')}")
+        else:
+            print(f"❌ Error: {yahoo_response.status_code} - {yahoo_response.text}")
+        
+        # Test 2: News website
+        print("\n2️⃣ Testing news website scraping...")
+        if isinstance(news_response, Exception):
+            print(f"❌ Exception: {news_response}")
+        elif news_response.status_code == 200:
+            result = news_response.json()
+            print(f"✅ Success: {result['success']}")
+            if result.get('data'):
+                print(f"📰 Headlines: {result['data'].get('headlines')}")
+                print(f"🔗 Links: {result['data'].get('links')}")
+        else:
+            print(f"❌ Error: {news_response.status_code} - {news_response.text}")
         
-        # Test 2: Webhook functionality
-        print("\n2️⃣ Testing webhook functionality...")
-        try:
-            response = await client.post(
-                "http://localhost:8000/scrape",
-                json=webhook_request,
-                timeout=30.0
-            )
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ Success: {result['success']}")
-                print(f"🔗 Webhook: {result.get('webhook')}")
-                print(f"🆔 Task ID: {result.get('task_id')}")
-            else:
-                print(f"❌ Error: {response.status_code} - {response.text}")
-        except Exception as e:
-            print(f"❌ Exception: {e}")
+        # Test 3: Webhook functionality
+        print("\n3️⃣ Testing webhook functionality...")
+        if isinstance(webhook_response, Exception):
+            print(f"❌ Exception: {webhook_response}")
+        elif webhook_response.status_code == 200:
+            result = webhook_response.json()
+            print(f"✅ Success: {result['success']}")
+            print(f"🔗 Webhook: {result.get('webhook')}")
+            print(f"🆔 Task ID: {result.get('task_id')}")
+        else:
+            print(f"❌ Error: {webhook_response.status_code} - {webhook_response.text}")
         
         print("\n🎉 Dynamic scraper testing completed!")
 
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Restart check: start the app twice in one process with the concurrency limits contended in both runs
+"""
+import asyncio
+import httpx
+import json
+from fastapi.testclient import TestClient
+from loguru import logger as log
+
+import main
+from config import MAX_CONCURRENT_SCRAPES, MAX_CONCURRENT_WEBHOOKS
+
+RUNS = 2
+# More deliveries than either limit allows at once, so both semaphores get waiters every run
+REQUESTS = max(MAX_CONCURRENT_SCRAPES, MAX_CONCURRENT_WEBHOOKS) + 2
+
+
+class StubResult:
+    """Minimal crawl result, enough for the selector extraction path"""
+    success = True
+    html = "<html><body><h1>Hello</h1></body></html>"
+    error_message = None
+    status_code = 200
+    response_headers = {}
+    links = {}
+    extracted_content = None
+
+
+class StubCrawler:
+    """Stands in for the browser; each crawl takes a moment so scrapes pile up on the semaphore"""
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def arun(self, url, config=None):
+        await asyncio.sleep(0.05)
+        return StubResult()
+
+
+def run_once(run: int, received: list):
+    """Fire REQUESTS webhook scrapes through one lifespan and wait for every delivery"""
+    with TestClient(main.app) as client:
+        for i in range(REQUESTS):
+            response = client.post("/scrape", json={
+                "url": f"https://example.com/{run}/{i}",
+                "selectors": [{"name": "title", "selector": "h1"}],
+                "webhook": f"https://receiver-{run}.test/hook",
+            })
+            assert response.json()["success"], response.text
+        # Leaving the block drains the background tasks, so wait for them while the app is still up
+        client.portal.call(_wait_for_deliveries, received, REQUESTS * (run + 1))
+
+
+async def _wait_for_deliveries(received: list, count: int, timeout: float = 10.0):
+    """Poll until the receiver has seen `count` webhooks in total"""
+    async def poll():
+        while len(received) < count:
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+def test_restart():
+    received = []
+    # A failed POST is retried, so a semaphore error can still end in a delivery; catch it in the log instead
+    failures = []
+    log.add(
+        lambda message: failures.append(message.record["message"]),
+        level="WARNING",
+        filter=lambda record: "webhook" in record["message"].lower(),
+    )
+
+    async def receiver(request: httpx.Request) -> httpx.Response:
+        # Slower than a whole batch of scrapes, so POSTs pile up on the webhook semaphore as well
+        await asyncio.sleep(0.5)
+        received.append(json.loads(request.content))
+        return httpx.Response(200)
+
+    # No browser and no network: stub the crawler and route webhooks to the in-process receiver
+    main.AsyncWebCrawler = StubCrawler
+    main.create_webhook_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(receiver))
+
+    for run in range(RUNS):
+        run_once(run, received)
+        errors = [payload for payload in received if "error" in payload]
+        assert not errors, f"Run {run} delivered errors: {errors[:3]}"
+        assert not failures, f"Run {run} had webhook failures: {failures[:3]}"
+        print(f"✅ Run {run}: {REQUESTS} webhook scrapes delivered")
+
+    print("\n🎉 App restarted cleanly under contention!")
+
+
+if __name__ == "__main__":
+    test_restart()